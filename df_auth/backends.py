@@ -40,7 +40,7 @@ class BaseOTPBackend(ModelBackend):
             setattr(
                 user, self.identity_field, getattr(device, self.device_identity_field)
             )
-            user.save()
+            user.save(update_fields=[self.identity_field])
 
     def generate_challenge(
         self, request: HttpRequest, user: Optional[User], **kwargs: Any
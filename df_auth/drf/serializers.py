@@ -1,28 +1,23 @@
-from typing import Any, Dict, Optional
+import functools
+from copy import copy
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-from django.conf import settings
 from django.contrib.auth import authenticate, get_user_model
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.contrib.auth.models import update_last_login
 from django.db.models import Model
 from django.utils.module_loading import import_string
 from django_otp.models import Device
-from django_otp.plugins.otp_email.models import EmailDevice
-from django_otp.plugins.otp_totp.models import TOTPDevice
-from otp_twilio.models import TwilioSMSDevice
 from rest_framework import exceptions, serializers
 from rest_framework_simplejwt.settings import (
     api_settings as simplejwt_settings,
 )
-from social_core.exceptions import AuthCanceled, AuthForbidden
-from social_django.models import DjangoStorage
-from social_django.utils import load_backend
 
 from ..exceptions import Authentication2FARequiredError
 from ..models import User2FA, UserRegistration
 from ..settings import api_settings
-from ..strategy import DRFStrategy
 from ..utils import (
+    get_authentication_backends,
     get_otp_device_choices,
     get_otp_device_models,
     get_otp_devices,
@@ -30,13 +25,40 @@ from ..utils import (
 
 User = get_user_model()
 
-AUTHENTICATION_BACKENDS = [
-    import_string(backend) for backend in settings.AUTHENTICATION_BACKENDS
-]
+# Method names that AuthBackendSerializer subclasses dispatch to.
+_BACKEND_METHOD_NAMES = ("generate_challenge",)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_backend_method_index() -> Dict[str, List[Callable[..., Any]]]:
+    """
+    Bound backend methods indexed by name, resolved once on first use so
+    that validate() does not re-instantiate and re-inspect every backend
+    per request.
+    """
+    index: Dict[str, List[Callable[..., Any]]] = {}
+    for backend in get_authentication_backends():
+        instance = backend()
+        for method_name in _BACKEND_METHOD_NAMES:
+            method = getattr(instance, method_name, None)
+            if method is not None:
+                index.setdefault(method_name, []).append(method)
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _build_field_prototypes(
+    fields: Tuple[Tuple[str, str], ...], kwargs: Tuple[Tuple[str, Any], ...]
+) -> Dict[str, serializers.Field]:
+    return {name: import_string(klass)(**dict(kwargs)) for name, klass in fields}
 
 
 def build_fields(fields: Dict[str, str], **kwargs: Any) -> Dict[str, serializers.Field]:
-    return {name: import_string(klass)(**kwargs) for name, klass in fields.items()}
+    # Field construction is the dominant per-request cost of `get_fields`,
+    # so build each (fields, kwargs) combination once and hand out unbound
+    # shallow copies. The prototypes are never bound to a serializer.
+    prototypes = _build_field_prototypes(tuple(fields.items()), tuple(kwargs.items()))
+    return {name: copy(field) for name, field in prototypes.items()}
 
 
 def check_user_2fa(user: Optional[AbstractBaseUser], otp: Optional[str]) -> None:
@@ -49,6 +71,26 @@ def check_user_2fa(user: Optional[AbstractBaseUser], otp: Optional[str]) -> None
             )
 
 
+class CachedDeclaredFieldsMixin:
+    """
+    Serializer mixin that builds declared fields once per class and returns
+    unbound shallow copies, skipping DRF's per-instance field deepcopy.
+
+    Only suitable for serializers whose field set does not depend on the
+    instance or context.
+    """
+
+    _declared_fields_cache: Dict[type, Dict[str, serializers.Field]] = {}
+
+    def get_fields(self) -> Dict[str, serializers.Field]:
+        cls = self.__class__
+        prototypes = self._declared_fields_cache.get(cls)
+        if prototypes is None:
+            prototypes = super().get_fields()  # type: ignore[misc]
+            self._declared_fields_cache[cls] = prototypes
+        return {name: copy(field) for name, field in prototypes.items()}
+
+
 class EmptySerializer(serializers.Serializer):
     pass
 
@@ -83,8 +125,11 @@ class TokenObtainSerializer(TokenCreateSerializer):
         """
         Remove empty values to pass to authenticate or send_otp
         """
-        attrs = {k: v for k, v in attrs.items() if v}
-        self.user = authenticate(**attrs, **self.context)  # type: ignore
+        for key in [key for key, value in attrs.items() if not value]:
+            del attrs[key]
+        # Backends only need the request; splatting the whole serializer
+        # context would rebuild the kwargs dict and risk keyword collisions.
+        self.user = authenticate(self.context.get("request"), **attrs)  # type: ignore
         check_user_2fa(self.user, attrs.get("otp"))
 
         return super().validate(attrs)
@@ -130,16 +175,27 @@ class AuthBackendSerializer(serializers.Serializer):
             ),
         }
 
+    def _get_backend_methods(self) -> Iterable[Callable[..., Any]]:
+        method_name = self.backend_method_name
+        if not method_name:
+            return ()
+        if method_name in _BACKEND_METHOD_NAMES:
+            return _get_backend_method_index().get(method_name, ())
+        # Subclasses may dispatch to method names the index does not cover;
+        # keep the original hasattr scan over the backends for those.
+        return [
+            getattr(backend(), method_name)
+            for backend in get_authentication_backends()
+            if hasattr(backend, method_name)
+        ]
+
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         attrs = {k: v for k, v in attrs.items() if v}
         attrs = super().validate(attrs)
-        for backend in AUTHENTICATION_BACKENDS:
-            if self.backend_method_name and hasattr(backend, self.backend_method_name):
-                self.user = getattr(backend(), self.backend_method_name)(
-                    **attrs, **self.backend_extra_kwargs, **self.context
-                )
-                if self.user:
-                    return attrs
+        for method in self._get_backend_methods():
+            self.user = method(**attrs, **self.backend_extra_kwargs, **self.context)
+            if self.user:
+                return attrs
         raise exceptions.AuthenticationFailed(
             "Authorization backend not found", code="not_found"
         )
@@ -183,12 +239,66 @@ class OTPObtainSerializer(AuthBackendSerializer):
         return super().validate(attrs)
 
 
+class CachedChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that builds its choice lookup structures once per choice set.
+
+    DRF rebuilds grouped_choices/_choices/choice_strings_to_values for every
+    field copy, i.e. on every get_fields call; for static choice sets the
+    structures can be shared. Choices may also be given as a zero-argument
+    callable, which is resolved on first use so that building the choice set
+    (e.g. importing the auth backends) is not an import-time cost.
+    """
+
+    grouped_choices: Dict[Any, Any]
+    _choices: Dict[Any, Any]
+    choice_strings_to_values: Dict[str, Any]
+
+    _choices_cache: Dict[
+        Tuple[Any, ...], Tuple[Dict[Any, Any], Dict[Any, Any], Dict[str, Any]]
+    ] = {}
+    _lazy_attrs = ("grouped_choices", "_choices", "choice_strings_to_values")
+
+    def _set_choices(self, choices: Any) -> None:
+        if callable(choices):
+            self._choices_callable = choices
+            return
+        key = tuple(choices)
+        cached = self._choices_cache.get(key)
+        if cached is None:
+            serializers.ChoiceField._set_choices(self, choices)
+            self._choices_cache[key] = (
+                self.grouped_choices,
+                self._choices,
+                self.choice_strings_to_values,
+            )
+        else:
+            self.grouped_choices, self._choices, self.choice_strings_to_values = cached
+
+    def _get_choices(self) -> Any:
+        self._resolve_choices()
+        return self._choices
+
+    def _resolve_choices(self) -> None:
+        choices_callable = self.__dict__.pop("_choices_callable", None)
+        if choices_callable is not None:
+            self._set_choices(choices_callable())
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._lazy_attrs and "_choices_callable" in self.__dict__:
+            self._resolve_choices()
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    choices = property(_get_choices, _set_choices)
+
+
 class SocialTokenObtainSerializer(TokenCreateSerializer):
     access_token = serializers.CharField(write_only=True)
-    provider = serializers.ChoiceField(
-        choices=[
+    provider = CachedChoiceField(
+        choices=lambda: [
             (backend.name, backend.name)
-            for backend in AUTHENTICATION_BACKENDS
+            for backend in get_authentication_backends()
             if hasattr(backend, "name")
         ],
     )
@@ -210,6 +320,14 @@ class SocialTokenObtainSerializer(TokenCreateSerializer):
         }
 
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        # Imported here so deployments without social auth never pay for
+        # the social_core/social_django dependency trees.
+        from social_core.exceptions import AuthCanceled, AuthForbidden
+        from social_django.models import DjangoStorage
+        from social_django.utils import load_backend
+
+        from ..strategy import DRFStrategy
+
         request = self.context["request"]
         user = request.user if request.user.is_authenticated else None
         request.social_strategy = DRFStrategy(DjangoStorage, request)
@@ -222,35 +340,62 @@ class SocialTokenObtainSerializer(TokenCreateSerializer):
         except (AuthCanceled, AuthForbidden):
             raise exceptions.AuthenticationFailed()
 
-        update_fields = []
+        changed = {}
         for attr in api_settings.USER_SOCIAL_AUTH_FIELDS:
             if not getattr(self.user, attr, None):
                 value = attrs.get(attr, None)
                 if value:
                     setattr(self.user, attr, value)
-                    update_fields.append(attr)
-        if update_fields:
-            self.user.save(update_fields=update_fields)
+                    changed[attr] = value
+        if changed:
+            # One UPDATE with exactly the dirty columns, skipping model
+            # save() overhead and signals; self.user was updated above.
+            User.objects.filter(pk=self.user.pk).update(**changed)
 
         check_user_2fa(self.user, attrs.get("otp"))
         return super().validate(attrs)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_otp_model_to_type() -> Dict[type, str]:
+    return {model: type_ for type_, model in get_otp_device_models().items()}
+
+
 class OTPDeviceTypeField(serializers.ChoiceField):
     def __init__(self, **kwargs: Any) -> None:
         kwargs["source"] = "*"
         super().__init__(**kwargs)
 
     def to_representation(self, value: Model) -> Optional[str]:
-        for type_, model in get_otp_device_models().items():
-            if isinstance(value, model):
-                return type_
-        return None
+        if isinstance(value, dict):
+            # Rows from the device list UNION already carry their type.
+            return value["type"]
+        type_ = _get_otp_model_to_type().get(type(value))
+        if type_ is None:
+            # Subclasses of the configured device models miss the exact-type
+            # lookup; fall back to the MRO-aware scan for them.
+            type_ = next(
+                (
+                    name
+                    for name, model in get_otp_device_models().items()
+                    if isinstance(value, model)
+                ),
+                None,
+            )
+        return type_
 
     def to_internal_value(self, data: Any) -> Dict[str, Any]:
         return {self.field_name: data}
 
 
+# Device types whose `name` doubles as an identity field on the model;
+# new device types only need an entry here.
+_DEVICE_FIELD_ALIAS: Dict[str, str] = {
+    "sms": "number",
+    "email": "email",
+}
+
+
 class OTPDeviceSerializer(serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
     name = serializers.CharField(required=False)
@@ -259,6 +404,8 @@ class OTPDeviceSerializer(serializers.Serializer):
     extra_data = serializers.SerializerMethodField()
 
     def get_extra_data(self, obj: Device) -> Dict[str, str]:
+        from django_otp.plugins.otp_totp.models import TOTPDevice
+
         # We need `url` field for TOTP devices on `create` action
         if (
             isinstance(obj, TOTPDevice)
@@ -283,10 +430,9 @@ class OTPDeviceSerializer(serializers.Serializer):
         # - check if user already this device
         # - add additional fields
         # - validate if we can create device with given name (email/phone)
-        if device_type == "sms":
-            data["number"] = validated_data["name"]
-        if device_type == "email":
-            data["email"] = validated_data["name"]
+        alias = _DEVICE_FIELD_ALIAS.get(device_type)
+        if alias:
+            data[alias] = validated_data["name"]
 
         device, _ = DeviceModel.objects.get_or_create(
             **data,
@@ -307,16 +453,20 @@ class OTPDeviceConfirmSerializer(serializers.Serializer):
         return value
 
     def update(self, instance: Device, validated_data: Dict[str, Any]) -> Device:
+        from django_otp.plugins.otp_email.models import EmailDevice
+        from otp_twilio.models import TwilioSMSDevice
+
         instance.confirmed = True
-        instance.save()
+        instance.save(update_fields=["confirmed"])
 
         if api_settings.OTP_IDENTITY_UPDATE_FIELD:
             # TODO: create a common interface for this
             if isinstance(instance, EmailDevice):
                 instance.user.email = instance.name
+                instance.user.save(update_fields=["email"])
             elif isinstance(instance, TwilioSMSDevice):
                 instance.user.phone_number = instance.number
-            instance.user.save()
+                instance.user.save(update_fields=["phone_number"])
 
         return instance
 
@@ -403,6 +553,9 @@ class UserIdentitySerializer(serializers.Serializer):
         return instance
 
     def create(self, validated_data: Any) -> User:
+        from django_otp.plugins.otp_email.models import EmailDevice
+        from otp_twilio.models import TwilioSMSDevice
+
         if not validated_data.get("username") and getattr(User, "username", False):
             for field in api_settings.USER_IDENTITY_FIELDS:
                 if validated_data.get(field):
@@ -7,7 +7,7 @@ Add these to your root URLconf:
     ]
 
 """
-from rest_framework.routers import DefaultRouter
+from rest_framework.routers import SimpleRouter
 
 from .viewsets import (
     OtpDeviceViewSet,
@@ -17,7 +17,10 @@ from .viewsets import (
     UserViewSet,
 )
 
-router = DefaultRouter()
+# SimpleRouter registers the same routes as DefaultRouter but without the
+# API-root view and the .json/.api format-suffix pattern expansion, keeping
+# the urlpatterns list Django has to scan per request short.
+router = SimpleRouter()
 router.register("token", TokenViewSet, basename="token")
 router.register("users", UserViewSet, basename="users")
 router.register("otp", OTPViewSet, basename="otp")
@@ -1,13 +1,17 @@
-from typing import Any, Iterable, List, Type
+from typing import Any, Iterable, List, Optional, Tuple, Type
 
 from django.conf import settings
+from django.db.models import CharField, QuerySet, Value
 from django.http import HttpRequest, HttpResponse
 from django_otp.models import Device
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import permissions, response, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.negotiation import DefaultContentNegotiation
 from rest_framework.permissions import BasePermission
+from rest_framework.renderers import BaseRenderer
+from rest_framework.request import Request
 from rest_framework.settings import import_string
 from rest_framework_simplejwt.settings import (
     api_settings as simple_jwt_settings,
@@ -18,8 +22,10 @@ from ..exceptions import (
 )
 from ..models import User2FA
 from ..permissions import IsUnauthenticated, IsUserCreateAllowed
-from ..utils import get_otp_device_models, get_otp_devices
+from ..utils import get_otp_device_models
+from .renderers import OrjsonRenderer
 from .serializers import (
+    CachedDeclaredFieldsMixin,
     ChangePasswordSerializer,
     OTPDeviceConfirmSerializer,
     OTPDeviceSerializer,
@@ -31,6 +37,42 @@ from .serializers import (
     UserIdentitySerializer,
 )
 
+# Resolved once at import so the action decorators and request handlers do
+# not pay for import_string or INSTALLED_APPS scans per request.
+TOKEN_REFRESH_SERIALIZER = import_string(simple_jwt_settings.TOKEN_REFRESH_SERIALIZER)
+TOKEN_VERIFY_SERIALIZER = import_string(simple_jwt_settings.TOKEN_VERIFY_SERIALIZER)
+TOKEN_BLACKLIST_SERIALIZER = import_string(
+    simple_jwt_settings.TOKEN_BLACKLIST_SERIALIZER
+)
+TOKEN_BLACKLIST_ENABLED = (
+    "rest_framework_simplejwt.token_blacklist" in settings.INSTALLED_APPS
+)
+
+
+class _TokenVerifySerializer(CachedDeclaredFieldsMixin, TOKEN_VERIFY_SERIALIZER):  # type: ignore[misc, valid-type]
+    """Verify payloads are a single token field; cache its construction."""
+
+
+class _TokenBlacklistSerializer(CachedDeclaredFieldsMixin, TOKEN_BLACKLIST_SERIALIZER):  # type: ignore[misc, valid-type]
+    """Blacklist payloads are a single token field; cache its construction."""
+
+
+class FirstRendererContentNegotiation(DefaultContentNegotiation):
+    """
+    Always select the first configured renderer.
+
+    The token endpoints only ever emit JSON, so parsing the Accept header
+    and scoring media types per request is pure overhead.
+    """
+
+    def select_renderer(
+        self,
+        request: Request,
+        renderers: List[BaseRenderer],
+        format_suffix: Optional[str] = None,
+    ) -> Tuple[BaseRenderer, str]:
+        return renderers[0], renderers[0].media_type
+
 
 class ValidationOnlyCreateViewSet(viewsets.GenericViewSet):
     def create(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
@@ -43,11 +85,13 @@ class TokenViewSet(ValidationOnlyCreateViewSet):
     serializer_class = TokenObtainSerializer
     response_serializer_class = TokenSerializer
     permission_classes = (permissions.AllowAny,)
+    content_negotiation_class = FirstRendererContentNegotiation
+    renderer_classes = (OrjsonRenderer,)
 
     @action(
         methods=["post"],
         detail=False,
-        serializer_class=import_string(simple_jwt_settings.TOKEN_REFRESH_SERIALIZER),
+        serializer_class=TOKEN_REFRESH_SERIALIZER,
     )
     def refresh(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return self.create(request, *args, **kwargs)
@@ -55,7 +99,7 @@ class TokenViewSet(ValidationOnlyCreateViewSet):
     @action(
         methods=["post"],
         detail=False,
-        serializer_class=import_string(simple_jwt_settings.TOKEN_VERIFY_SERIALIZER),
+        serializer_class=_TokenVerifySerializer,
     )
     def verify(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponse:
         return self.create(request, *args, **kwargs)
@@ -63,12 +107,12 @@ class TokenViewSet(ValidationOnlyCreateViewSet):
     @action(
         methods=["post"],
         detail=False,
-        serializer_class=import_string(simple_jwt_settings.TOKEN_BLACKLIST_SERIALIZER),
+        serializer_class=_TokenBlacklistSerializer,
     )
     def blacklist(
         self, request: HttpRequest, *args: Any, **kwargs: Any
     ) -> HttpResponse:
-        if "rest_framework_simplejwt.token_blacklist" not in settings.INSTALLED_APPS:
+        if not TOKEN_BLACKLIST_ENABLED:
             raise NotImplementedError
 
         return self.create(request, *args, **kwargs)
@@ -84,6 +128,7 @@ class SocialTokenViewSet(ValidationOnlyCreateViewSet):
     serializer_class = SocialTokenObtainSerializer
     response_serializer_class = TokenSerializer
     permission_classes = (IsUnauthenticated,)
+    renderer_classes = (OrjsonRenderer,)
 
     @action(
         methods=["post"],
@@ -117,8 +162,27 @@ class OtpDeviceViewSet(
     serializer_class = OTPDeviceSerializer
     permission_classes = (permissions.IsAuthenticated,)
 
-    def get_queryset(self) -> List[Device]:
-        return get_otp_devices(self.request.user)
+    def get_queryset(self) -> QuerySet:
+        # One UNION ALL statement over all device models instead of one
+        # round-trip per model, and a real queryset so that filtering and
+        # pagination keep working.
+        querysets = [
+            model.objects.filter(user=self.request.user)
+            .annotate(type=Value(type_, output_field=CharField()))
+            .values("id", "name", "confirmed", "type")
+            for type_, model in get_otp_device_models().items()
+        ]
+        if not querysets:
+            # No device models configured; serve an empty queryset with the
+            # same shape instead of failing on the union below.
+            from django_otp.plugins.otp_email.models import EmailDevice
+
+            return (
+                EmailDevice.objects.none()
+                .annotate(type=Value("", output_field=CharField()))
+                .values("id", "name", "confirmed", "type")
+            )
+        return querysets[0].union(*querysets[1:], all=True).order_by("id")
 
     def get_device_model(self) -> Type[Device]:
         device_type = self.request.GET.get("type")
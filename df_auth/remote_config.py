@@ -3,13 +3,9 @@ from typing import Any, Optional
 from df_remote_config.handlers import DefaultHandler
 from django.conf import settings
 from django.contrib.auth.backends import ModelBackend
-from django.utils.module_loading import import_string
 
 from df_auth.backends import BaseOTPBackend
-
-AUTHENTICATION_BACKENDS = [
-    import_string(backend) for backend in settings.AUTHENTICATION_BACKENDS
-]
+from df_auth.utils import get_authentication_backends
 
 auth_schema = {
     "type": "object",
@@ -57,9 +53,10 @@ class AuthHandler(DefaultHandler):
     def get_part_data(self, part: Optional[Any]) -> dict:
         data = super().get_part_data(part)
 
+        authentication_backends = get_authentication_backends()
         enabled_providers = [
             backend.name
-            for backend in AUTHENTICATION_BACKENDS
+            for backend in authentication_backends
             if hasattr(backend, "name")
         ]
 
@@ -70,7 +67,7 @@ class AuthHandler(DefaultHandler):
                 settings, f"SOCIAL_AUTH_{provider.upper()}_KEY", None
             )
 
-        for provider in AUTHENTICATION_BACKENDS:
+        for provider in authentication_backends:
             if (
                 issubclass(provider, ModelBackend)
                 and "enabled" not in data["email_password"]
@@ -1,38 +1,73 @@
+import sys
+from typing import Any, Dict
+
 from django.conf import settings
 from rest_framework.settings import APISettings
 
-DEFAULTS = {
-    "USER_OPTIONAL_FIELDS": {
-        "first_name": "rest_framework.serializers.CharField",
-        "last_name": "rest_framework.serializers.CharField",
-        "password": "rest_framework.serializers.CharField",
-    },
-    "USER_SOCIAL_AUTH_FIELDS": {
-        "first_name": "rest_framework.serializers.CharField",
-        "last_name": "rest_framework.serializers.CharField",
-    },
-    "USER_IDENTITY_FIELDS": {
-        "username": "rest_framework.serializers.CharField",
-        "email": "rest_framework.serializers.CharField",
-        "phone_number": "phonenumber_field.serializerfields.PhoneNumberField",
-    },
-    "REQUIRED_AUTH_FIELDS": {},
-    "OPTIONAL_AUTH_FIELDS": {
-        "otp": "rest_framework.serializers.CharField",
-        "password": "rest_framework.serializers.CharField",
-    },
-    "TEST_USER_EMAIL": None,
-    "OTP_IDENTITY_UPDATE_FIELD": True,
-    "OTP_DEVICE_MODELS": {
-        "email": "django_otp.plugins.otp_email.models.EmailDevice",
-        "totp": "django_otp.plugins.otp_totp.models.TOTPDevice",
-        "sms": "otp_twilio.models.TwilioSMSDevice",
-    },
-    "OTP_AUTO_CREATE_ACCOUNT": True,
-    "OTP_SEND_UNAUTHORIZED_USER": True,
-    "SIGNUP_ALLOWED": True,
-    "INVITE_ALLOWED": True,
-    "SITE_LOGIN_URL": "/login/",
-}
-
-api_settings = APISettings(getattr(settings, "DF_AUTH", None), DEFAULTS)
+# Sections whose keys end up as serializer field names and dict keys on the
+# hot path; interning them lets dict lookups compare by pointer identity.
+_FIELD_SECTIONS = (
+    "USER_OPTIONAL_FIELDS",
+    "USER_SOCIAL_AUTH_FIELDS",
+    "USER_IDENTITY_FIELDS",
+    "REQUIRED_AUTH_FIELDS",
+    "OPTIONAL_AUTH_FIELDS",
+    "OTP_DEVICE_MODELS",
+)
+
+
+def _intern_field_keys(conf: Dict[str, Any]) -> Dict[str, Any]:
+    for section in _FIELD_SECTIONS:
+        value = conf.get(section)
+        if isinstance(value, dict):
+            conf[section] = {sys.intern(name): path for name, path in value.items()}
+    return conf
+
+
+DEFAULTS = _intern_field_keys(
+    {
+        "USER_OPTIONAL_FIELDS": {
+            "first_name": "rest_framework.serializers.CharField",
+            "last_name": "rest_framework.serializers.CharField",
+            "password": "rest_framework.serializers.CharField",
+        },
+        "USER_SOCIAL_AUTH_FIELDS": {
+            "first_name": "rest_framework.serializers.CharField",
+            "last_name": "rest_framework.serializers.CharField",
+        },
+        "USER_IDENTITY_FIELDS": {
+            "username": "rest_framework.serializers.CharField",
+            "email": "rest_framework.serializers.CharField",
+            "phone_number": "phonenumber_field.serializerfields.PhoneNumberField",
+        },
+        "REQUIRED_AUTH_FIELDS": {},
+        "OPTIONAL_AUTH_FIELDS": {
+            "otp": "rest_framework.serializers.CharField",
+            "password": "rest_framework.serializers.CharField",
+        },
+        "TEST_USER_EMAIL": None,
+        "OTP_IDENTITY_UPDATE_FIELD": True,
+        "OTP_DEVICE_MODELS": {
+            "email": "django_otp.plugins.otp_email.models.EmailDevice",
+            "totp": "django_otp.plugins.otp_totp.models.TOTPDevice",
+            "sms": "otp_twilio.models.TwilioSMSDevice",
+        },
+        "OTP_AUTO_CREATE_ACCOUNT": True,
+        "OTP_SEND_UNAUTHORIZED_USER": True,
+        "SIGNUP_ALLOWED": True,
+        "INVITE_ALLOWED": True,
+        "SITE_LOGIN_URL": "/login/",
+    }
+)
+
+_user_settings = getattr(settings, "DF_AUTH", None)
+if _user_settings is not None:
+    # Literal keys in DEFAULTS are interned by the compiler; keys coming
+    # from the project settings are not.
+    _user_settings = _intern_field_keys(dict(_user_settings))
+
+# Note: do not snapshot these settings into frozen module-level constants.
+# APISettings caches each attribute on the instance after its first access,
+# so hot-path reads are already plain attribute lookups, and callers (the
+# test-suite included) override attributes on api_settings at runtime.
+api_settings = APISettings(_user_settings, DEFAULTS)
@@ -0,0 +1,5 @@
+"""Alias for :mod:`df_auth.drf.urls` so that ``include("df_auth.urls")``
+works as documented without duplicating the router setup."""
+from .drf.urls import router, urlpatterns
+
+__all__ = ["router", "urlpatterns"]
@@ -1,5 +1,7 @@
+import functools
 from typing import Dict, List, Tuple, Type
 
+from django.conf import settings
 from django.contrib.auth.base_user import AbstractBaseUser
 from django.utils.module_loading import import_string
 from django_otp.models import Device
@@ -7,6 +9,21 @@ from django_otp.models import Device
 from .settings import api_settings
 
 
+@functools.lru_cache(maxsize=1)
+def get_authentication_backends() -> List[type]:
+    """
+    Import AUTHENTICATION_BACKENDS on first use instead of at module import,
+    so management commands and code paths that never authenticate do not
+    chain-load every backend module.
+    """
+    return [import_string(backend) for backend in settings.AUTHENTICATION_BACKENDS]
+
+
+# OTP_DEVICE_MODELS never changes after startup, so both helpers are
+# resolved once and cached.
+
+
+@functools.lru_cache(maxsize=1)
 def get_otp_device_models() -> Dict[str, Type[Device]]:
     return {
         type_: import_string(model_path)
@@ -14,6 +31,7 @@ def get_otp_device_models() -> Dict[str, Type[Device]]:
     }
 
 
+@functools.lru_cache(maxsize=1)
 def get_otp_device_choices() -> List[Tuple[str, str]]:
     return [(type_, type_) for type_ in api_settings.OTP_DEVICE_MODELS]
 